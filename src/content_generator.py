@@ -2,15 +2,25 @@
 AI-powered content generation using Anthropic Claude
 """
 import os
+import copy
 import json
 import re
-from anthropic import Anthropic
+import time
 from typing import Optional, List, Dict
 import yaml
 import random
 from datetime import datetime
+from functools import lru_cache
 from prompt_loader import get_prompt_loader
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback when orjson is absent
+    orjson = None
+
+# libyaml's C loader when PyYAML was built with it; pure-Python otherwise
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def _truncate_at_sentence(text: str, max_length: int) -> str:
     """
@@ -51,6 +61,208 @@ def _truncate_at_sentence(text: str, max_length: int) -> str:
     return truncated.rstrip()
 
 
+def _trim_cut_off(text: str) -> str:
+    """
+    Trim a response the API stopped at max_tokens back to its last complete
+    sentence (or word), even when it is already under the length limit.
+    An opening quote whose closing quote was cut off is dropped too.
+    """
+    if text[:1] in ('"', "'") and not text.endswith(text[0]):
+        text = text[1:]
+    if text.rstrip('"\'').endswith(('.', '!', '?')):
+        return text
+    return _truncate_at_sentence(text, len(text) - 1)
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(config_path: str, mtime_ns: int) -> dict:
+    """
+    Parse a config.yaml once per (path, mtime). The mtime is part of the
+    cache key so an edited file is re-read on the next load.
+    """
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlSafeLoader)
+
+
+def _load_config_file(config_path: str) -> dict:
+    """Return a private copy of the parsed config at config_path."""
+    config_path = os.path.abspath(config_path)
+    parsed = _parse_config_file(config_path, os.stat(config_path).st_mtime_ns)
+    return copy.deepcopy(parsed)
+
+
+# Patterns that indicate meta-commentary about inability to report
+_META_COMMENTARY_PATTERNS = (
+    "i cannot",
+    "i can't",
+    "cannot generate",
+    "cannot write",
+    "can't generate",
+    "can't write",
+    "unable to",
+    "don't have information",
+    "don't have details",
+    "don't have enough",
+    "do not have information",
+    "no information available",
+    "article doesn't",
+    "article does not",
+    "article won't",
+    "article will not",
+    "content provided",
+    "content only shows",
+    "paywall",
+    "subscription required",
+    "subscription page",
+    "following strict rules",
+    "without the actual",
+    "not the actual article",
+    "can't access",
+    "cannot access",
+)
+
+# Patterns that indicate contradicting news / fact-checking with outdated knowledge
+_CONTRADICTION_PATTERNS = (
+    # Claiming events didn't happen
+    "never happened",
+    "didn't happen",
+    "did not happen",
+    "hasn't happened",
+    "has not happened",
+    "won't happen",
+    "isn't happening",
+    "is not happening",
+    # Claiming something is fake
+    "complete fiction",
+    "totally fiction",
+    "fabricated",
+    "made up story",
+    "fake news",
+    "not real",
+    "isn't real",
+    "is not real",
+    "doesn't exist",
+    "does not exist",
+    # Claiming someone is still alive/in office (contradicting news)
+    "is alive",
+    "is still alive",
+    "still alive",
+    "is very much alive",
+    "hasn't died",
+    "has not died",
+    "didn't die",
+    "did not die",
+    "is still in office",
+    "still in office",
+    "hasn't resigned",
+    "has not resigned",
+    "didn't resign",
+    # Fact-checking phrases
+    "actually,",
+    "however,",  # At start of correction
+    "in fact,",
+    "contrary to",
+    "that's not true",
+    "that is not true",
+    "that's wrong",
+    "that is wrong",
+    "that's incorrect",
+    "that is incorrect",
+    "this is false",
+    "this is incorrect",
+    "this is wrong",
+    "not accurate",
+    "isn't accurate",
+    "is not accurate",
+    # Correcting news sources
+    "the article is wrong",
+    "the news is wrong",
+    "the report is wrong",
+    "the headline is wrong",
+    "misinformation",
+    "disinformation",
+)
+
+# Temporal skepticism patterns - questioning article dates/timelines
+_TEMPORAL_SKEPTICISM_PATTERNS = (
+    "the date says",
+    "the date is wrong",
+    "dates are wrong",
+    "date seems off",
+    "dates seem off",
+    "calendar is broken",
+    "calendar is wrong",
+    "time-travel",
+    "time travel",
+    "quite the typo",
+    "that's a typo",
+    "that is a typo",
+    "must be a typo",
+    "seems like a typo",
+    "dates don't match",
+    "dates don't add up",
+    "date doesn't add up",
+    "but the date",
+    "headline, but the date",
+    "in the headline, but",
+)
+
+
+def _compile_phrases(phrases: tuple) -> re.Pattern:
+    """
+    Compile literal phrases into one alternation for a fast any-match test.
+    A match is the leftmost hit in the text, not the first phrase in the list.
+    """
+    return re.compile('|'.join(re.escape(phrase) for phrase in phrases))
+
+
+_META_COMMENTARY_RE = _compile_phrases(_META_COMMENTARY_PATTERNS)
+_CONTRADICTION_RE = _compile_phrases(_CONTRADICTION_PATTERNS)
+_TEMPORAL_SKEPTICISM_RE = _compile_phrases(_TEMPORAL_SKEPTICISM_PATTERNS)
+
+
+# Image prompts are cut to this many characters after generation
+_IMAGE_PROMPT_MAX_CHARS = 800
+
+# Smallest output-token budget _max_tokens_for_chars hands out
+_MIN_OUTPUT_TOKENS = 150
+
+# Longest poll_batch waits by default: the Batches API expires any batch
+# still processing after 24 hours
+_BATCH_POLL_TIMEOUT = 24 * 60 * 60
+
+# JSON replies from the framing check: a ```json fenced block, or a bare
+# object with prose around it
+_CODE_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _max_tokens_for_chars(max_chars: int) -> int:
+    """
+    Output-token budget for a response that gets cut to max_chars anyway.
+
+    English runs ~4 characters per token, but emoji, URLs and punctuation run
+    well under 3, so the budget is 1.5x the English estimate (and never below
+    _MIN_OUTPUT_TOKENS). That still stops a runaway response near the cut-off
+    without clipping ordinary ones.
+    """
+    return max(_MIN_OUTPUT_TOKENS, -(-max_chars * 3 // 8))
+
+
+def _json_loads(raw):
+    """Parse JSON (str or bytes), preferring orjson's native decoder."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize JSON (2-space indent), preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
 def _strip_quotes(text: str) -> str:
     """Remove surrounding quote characters Claude sometimes adds."""
     if len(text) >= 2 and text[0] in ('"', "'") and text[0] == text[-1]:
@@ -58,6 +270,52 @@ def _strip_quotes(text: str) -> str:
     return text
 
 
+class _AnthropicRateLimiter:
+    """
+    Token-bucket pacing for Messages API calls.
+
+    Request and token buckets start full and refill continuously at their
+    per-minute rates; reserve() waits until both have room rather than
+    letting a call fail with a 429 and retry blind.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.request_capacity = float(rpm)
+        self.token_capacity = float(tpm)
+        self.request_fill_rate = rpm / 60.0
+        self.token_fill_rate = tpm / 60.0
+        self._available_requests = self.request_capacity
+        self._available_tokens = self.token_capacity
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(
+            self.request_capacity,
+            self._available_requests + elapsed * self.request_fill_rate)
+        self._available_tokens = min(
+            self.token_capacity,
+            self._available_tokens + elapsed * self.token_fill_rate)
+
+    def reserve(self, est_tokens: int):
+        """Block until one request and est_tokens tokens are available, then take them"""
+        # A single call larger than the whole bucket would otherwise wait forever
+        est_tokens = min(est_tokens, self.token_capacity)
+        while True:
+            self._refill()
+            if self._available_requests >= 1 and self._available_tokens >= est_tokens:
+                self._available_requests -= 1
+                self._available_tokens -= est_tokens
+                return
+            wait = max(
+                (1 - self._available_requests) / self.request_fill_rate,
+                (est_tokens - self._available_tokens) / self.token_fill_rate,
+            )
+            time.sleep(max(wait, 0.01))
+
+
 class ContentGenerator:
     """Generates news cat reporter tweet content using Claude AI"""
 
@@ -67,14 +325,30 @@ class ContentGenerator:
         if config_path is None:
             config_path = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
 
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self._init_from_config(_load_config_file(config_path))
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ContentGenerator":
+        """Build a generator from an already-parsed config dict (no file I/O).
+
+        The dict is used as-is, not copied.
+        """
+        generator = cls.__new__(cls)
+        generator._init_from_config(config)
+        return generator
+
+    def _init_from_config(self, config: dict):
+        """Set up the client and config-derived settings shared by both constructors"""
+        self.config = config
 
         # Initialize Anthropic client
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("Missing ANTHROPIC_API_KEY. Check your .env file.")
 
+        # Local import: the SDK takes over a second to import, and modules
+        # that only need _truncate_at_sentence shouldn't pay for it
+        from anthropic import Anthropic
         self.client = Anthropic(api_key=api_key)
         self.model = self.config['content']['model']
         self.topics = self.config['content']['topics']
@@ -86,6 +360,16 @@ class ContentGenerator:
         if not self.vocab_by_topic:
             self.vocab_by_topic = {}
             self.vocab_universal = self.config['content'].get('cat_vocabulary', [])
+        # Lowercased once: category keywords for story matching, and every
+        # known phrase (with its lowercase form) for _record_used_phrase
+        self._vocab_keywords = {
+            category: tuple(kw.lower() for kw in data.get('keywords', []))
+            for category, data in self.vocab_by_topic.items()
+        }
+        all_phrases = list(self.vocab_universal)
+        for data in self.vocab_by_topic.values():
+            all_phrases.extend(data.get('phrases', []))
+        self._all_vocab_phrases = tuple((phrase, phrase.lower()) for phrase in all_phrases)
         self.engagement_hooks = self.config['content'].get('engagement_hooks', [])
         self.time_of_day = self.config['content'].get('time_of_day', {})
         self.cat_humor = self.config['content'].get('cat_humor', [])
@@ -93,6 +377,12 @@ class ContentGenerator:
         self.max_length = self.config['content']['max_length']
         self.avoid_topics = self.config['safety']['avoid_topics']
 
+        # Config-derived prompt fields, joined once rather than per prompt build
+        self._avoid_str = ", ".join(self.avoid_topics)
+        self._guidelines_str = "\n- ".join(self.editorial_guidelines)
+        self._engagement_str = ", ".join((self.engagement_hooks or [])[:3])
+        self._cat_humor_str = ", ".join(self.cat_humor or [])
+
         # Load recently used phrases for anti-repetition
         self._recent_phrases_file = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -105,10 +395,19 @@ class ContentGenerator:
 
         # How many recent phrases to track for anti-repetition
         self._recent_phrases_limit = 20
+        # (path, mtime_ns, size, phrases) from the last read/write of the file
+        self._recent_phrases_cache = None
 
         # Initialize prompt loader
         self.prompts = get_prompt_loader()
 
+        # Optional client-side pacing (anthropic.rpm / anthropic.tpm)
+        limits = self.config.get('anthropic') or {}
+        if limits.get('rpm') and limits.get('tpm'):
+            self._limiter = _AnthropicRateLimiter(limits['rpm'], limits['tpm'])
+        else:
+            self._limiter = None
+
     def _select_vocab_for_story(self, topic: str, article_details: str = None) -> str:
         """
         Match story content against vocab categories and return relevant phrases.
@@ -126,9 +425,8 @@ class ContentGenerator:
 
         # Score each category by keyword hits
         category_scores = {}
-        for category, data in self.vocab_by_topic.items():
-            keywords = data.get('keywords', [])
-            score = sum(1 for kw in keywords if kw.lower() in search_text)
+        for category, keywords in self._vocab_keywords.items():
+            score = sum(1 for kw in keywords if kw in search_text)
             if score > 0:
                 category_scores[category] = score
 
@@ -155,7 +453,7 @@ class ContentGenerator:
             print("   🐱 Vocab: no topic match, using universal phrases")
 
         # Filter out recently used phrases
-        recent = self._load_recent_phrases()
+        recent = set(self._load_recent_phrases())
         available = [p for p in matched_phrases if p not in recent]
 
         # If filtering removed everything, allow all but still note it
@@ -170,16 +468,30 @@ class ContentGenerator:
 
         return ", ".join(selected)
 
+    def _recent_phrases_key(self):
+        """(path, mtime_ns, size) identifying the current file version, or None if missing"""
+        path = self._recent_phrases_file
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (path, st.st_mtime_ns, st.st_size)
+
     def _load_recent_phrases(self) -> List[str]:
-        """Load the list of recently used phrases from disk."""
+        """Load the list of recently used phrases (re-read only when the file changes)."""
+        key = self._recent_phrases_key()
+        if key is None:
+            return []
+        cached = self._recent_phrases_cache
+        if cached is not None and cached[:3] == key:
+            return list(cached[3])
         try:
-            if os.path.exists(self._recent_phrases_file):
-                with open(self._recent_phrases_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('recent_phrases', [])
+            with open(self._recent_phrases_file, 'rb') as f:
+                phrases = _json_loads(f.read()).get('recent_phrases', [])
         except (json.JSONDecodeError, IOError):
-            pass
-        return []
+            return []
+        self._recent_phrases_cache = key + (phrases,)
+        return list(phrases)
 
     def _record_used_phrase(self, tweet_text: str):
         """
@@ -188,26 +500,47 @@ class ContentGenerator:
         """
         tweet_lower = tweet_text.lower()
         recent = self._load_recent_phrases()
+        before = list(recent)
 
         # Check all phrases across all categories + universal
-        all_phrases = list(self.vocab_universal)
-        for data in self.vocab_by_topic.values():
-            all_phrases.extend(data.get('phrases', []))
-
-        for phrase in all_phrases:
+        for phrase, phrase_lower in self._all_vocab_phrases:
             # Check if the phrase (or a close variation) appears in the tweet
-            if phrase.lower() in tweet_lower:
+            if phrase_lower in tweet_lower:
                 if phrase not in recent:
                     recent.append(phrase)
 
         # Keep only the most recent N phrases
         recent = recent[-self._recent_phrases_limit:]
+        cached = self._recent_phrases_cache
+        if recent == before and cached is not None and cached[:3] == self._recent_phrases_key():
+            return  # nothing new to record; the file already holds this list
 
         try:
-            with open(self._recent_phrases_file, 'w') as f:
-                json.dump({'recent_phrases': recent}, f, indent=2)
+            with open(self._recent_phrases_file, 'wb') as f:
+                f.write(_json_dumps({'recent_phrases': recent}))
         except IOError as e:
             print(f"   ⚠️  Could not save recent phrases: {e}")
+            return
+        key = self._recent_phrases_key()
+        self._recent_phrases_cache = key + (recent,) if key else None
+
+    def _build_params(self, prompt: str, max_tokens: int) -> dict:
+        """Messages API params for a single-turn prompt.
+
+        Shared by _create_message and generate_batch entries.
+        """
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _create_message(self, prompt: str, max_tokens: int):
+        """messages.create for a single-turn prompt, paced by the rate limiter if configured"""
+        if self._limiter is not None:
+            # ~4 characters per token is close enough for pacing
+            self._limiter.reserve(len(prompt) // 4 + max_tokens)
+        return self.client.messages.create(**self._build_params(prompt, max_tokens))
 
     def generate_tweet(self, topic: Optional[str] = None, trending_topic: Optional[str] = None,
                       story_metadata: Optional[Dict] = None, previous_posts: Optional[List[Dict]] = None) -> Dict:
@@ -285,13 +618,7 @@ class ContentGenerator:
                                                  article_details=article_details, previous_posts=previous_posts)
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=350,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            message = self._create_message(prompt, 350)
 
             tweet = message.content[0].text.strip()
 
@@ -370,13 +697,7 @@ class ContentGenerator:
         )
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=300,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            message = self._create_message(prompt, 300)
 
             shortened = message.content[0].text.strip()
 
@@ -397,141 +718,18 @@ class ContentGenerator:
         """
         tweet_lower = tweet.lower()
 
-        # Patterns that indicate meta-commentary about inability to report
-        meta_commentary_patterns = [
-            "i cannot",
-            "i can't",
-            "cannot generate",
-            "cannot write",
-            "can't generate",
-            "can't write",
-            "unable to",
-            "don't have information",
-            "don't have details",
-            "don't have enough",
-            "do not have information",
-            "no information available",
-            "article doesn't",
-            "article does not",
-            "article won't",
-            "article will not",
-            "content provided",
-            "content only shows",
-            "paywall",
-            "subscription required",
-            "subscription page",
-            "following strict rules",
-            "without the actual",
-            "not the actual article",
-            "can't access",
-            "cannot access",
-        ]
-
-        for pattern in meta_commentary_patterns:
-            if pattern in tweet_lower:
-                return {
-                    'valid': False,
-                    'reason': f"Contains meta-commentary pattern: '{pattern}'"
-                }
-
-        # Patterns that indicate contradicting news / fact-checking with outdated knowledge
-        contradiction_patterns = [
-            # Claiming events didn't happen
-            "never happened",
-            "didn't happen",
-            "did not happen",
-            "hasn't happened",
-            "has not happened",
-            "won't happen",
-            "isn't happening",
-            "is not happening",
-            # Claiming something is fake
-            "complete fiction",
-            "totally fiction",
-            "fabricated",
-            "made up story",
-            "fake news",
-            "not real",
-            "isn't real",
-            "is not real",
-            "doesn't exist",
-            "does not exist",
-            # Claiming someone is still alive/in office (contradicting news)
-            "is alive",
-            "is still alive",
-            "still alive",
-            "is very much alive",
-            "hasn't died",
-            "has not died",
-            "didn't die",
-            "did not die",
-            "is still in office",
-            "still in office",
-            "hasn't resigned",
-            "has not resigned",
-            "didn't resign",
-            # Fact-checking phrases
-            "actually,",
-            "however,",  # At start of correction
-            "in fact,",
-            "contrary to",
-            "that's not true",
-            "that is not true",
-            "that's wrong",
-            "that is wrong",
-            "that's incorrect",
-            "that is incorrect",
-            "this is false",
-            "this is incorrect",
-            "this is wrong",
-            "not accurate",
-            "isn't accurate",
-            "is not accurate",
-            # Correcting news sources
-            "the article is wrong",
-            "the news is wrong",
-            "the report is wrong",
-            "the headline is wrong",
-            "misinformation",
-            "disinformation",
-        ]
-
-        for pattern in contradiction_patterns:
-            if pattern in tweet_lower:
-                return {
-                    'valid': False,
-                    'reason': f"Contains news-contradiction pattern: '{pattern}'"
-                }
-
-        # Temporal skepticism patterns - questioning article dates/timelines
-        temporal_skepticism_patterns = [
-            "the date says",
-            "the date is wrong",
-            "dates are wrong",
-            "date seems off",
-            "dates seem off",
-            "calendar is broken",
-            "calendar is wrong",
-            "time-travel",
-            "time travel",
-            "quite the typo",
-            "that's a typo",
-            "that is a typo",
-            "must be a typo",
-            "seems like a typo",
-            "dates don't match",
-            "dates don't add up",
-            "date doesn't add up",
-            "but the date",
-            "headline, but the date",
-            "in the headline, but",
-        ]
-
-        for pattern in temporal_skepticism_patterns:
-            if pattern in tweet_lower:
+        checks = (
+            (_META_COMMENTARY_RE, _META_COMMENTARY_PATTERNS, "meta-commentary"),
+            (_CONTRADICTION_RE, _CONTRADICTION_PATTERNS, "news-contradiction"),
+            (_TEMPORAL_SKEPTICISM_RE, _TEMPORAL_SKEPTICISM_PATTERNS, "temporal skepticism"),
+        )
+        for pattern_re, phrases, label in checks:
+            if pattern_re.search(tweet_lower):
+                # Name the first listed phrase that matched, not the leftmost hit
+                phrase = next(p for p in phrases if p in tweet_lower)
                 return {
                     'valid': False,
-                    'reason': f"Contains temporal skepticism pattern: '{pattern}'"
+                    'reason': f"Contains {label} pattern: '{phrase}'"
                 }
 
         return {'valid': True, 'reason': None}
@@ -540,9 +738,7 @@ class ContentGenerator:
                                article_details: str = None, previous_posts: Optional[List[Dict]] = None) -> str:
         """Build the news cat reporter prompt for Claude using prompt templates"""
         # Prepare config-based values
-        avoid_str = ", ".join(self.avoid_topics)
         cat_vocab_str = self._select_vocab_for_story(topic, article_details)
-        guidelines_str = "\n- ".join(self.editorial_guidelines)
 
         # Calculate actual max length for the prompt
         source_indicator_length = 4  # " 📰↓"
@@ -566,9 +762,6 @@ class ContentGenerator:
         time_phrases = self.time_of_day.get(time_period, [])
         time_phrases_str = ", ".join(time_phrases) if time_phrases else ""
 
-        engagement_str = ", ".join(self.engagement_hooks[:3]) if self.engagement_hooks else ""
-        cat_humor_str = ", ".join(self.cat_humor) if self.cat_humor else ""
-
         # Build conditional sections
         story_guidance = ""
         update_guidance = ""
@@ -605,17 +798,17 @@ class ContentGenerator:
             topic=topic,
             update_guidance=update_guidance,
             cat_vocab_str=cat_vocab_str,
-            guidelines_str=guidelines_str,
+            guidelines_str=self._guidelines_str,
             story_guidance=story_guidance,
             style=self.style,
             current_date=current_date,
             day_of_week=day_of_week,
             time_period=time_period,
             time_phrases_str=time_phrases_str,
-            cat_humor_str=cat_humor_str,
-            engagement_str=engagement_str,
+            cat_humor_str=self._cat_humor_str,
+            engagement_str=self._engagement_str,
             prompt_max_length=prompt_max_length,
-            avoid_str=avoid_str
+            avoid_str=self._avoid_str
         )
 
     def analyze_media_framing(self, story_metadata: Dict) -> Dict:
@@ -639,21 +832,16 @@ class ContentGenerator:
         )
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=200,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            message = self._create_message(prompt, 200)
 
             response_text = message.content[0].text.strip()
 
-            # Parse JSON
-            if '```json' in response_text:
-                response_text = response_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in response_text:
-                response_text = response_text.split('```')[1].split('```')[0].strip()
+            # Parse JSON: the first fenced block if any, else the outermost {...}
+            match = _CODE_FENCE_RE.search(response_text) or _JSON_OBJECT_RE.search(response_text)
+            if match:
+                response_text = match.group(match.lastindex or 0)
 
-            return json.loads(response_text)
+            return _json_loads(response_text)
 
         except Exception:
             return {'has_issues': False, 'angle': None}
@@ -669,7 +857,6 @@ class ContentGenerator:
 
         article_text = f"Title: {title}\n{content}"
         cat_vocab_str = self._select_vocab_for_story(title, article_text)
-        cat_humor_str = ", ".join(self.cat_humor) if self.cat_humor else ""
 
         return self.prompts.load_framing_tweet(
             title=title,
@@ -677,7 +864,7 @@ class ContentGenerator:
             framing_angle=framing_angle,
             content=content,
             cat_vocab_str=cat_vocab_str,
-            cat_humor_str=cat_humor_str,
+            cat_humor_str=self._cat_humor_str,
             style=self.style
         )
 
@@ -736,16 +923,14 @@ class ContentGenerator:
         )
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=300,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            message = self._create_message(prompt, _max_tokens_for_chars(self.max_length))
 
             reply = message.content[0].text.strip()
 
+            # The token cap can stop generation mid-word below max_length
+            if message.stop_reason == "max_tokens":
+                reply = _trim_cut_off(reply)
+
             # Remove quotes if present
             reply = _strip_quotes(reply)
 
@@ -788,16 +973,15 @@ FULL ARTICLE CONTENT (extract visual details from this):
                 article_section=article_section
             )
 
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=350,  # Increased for more detailed, contextual prompts
-                messages=[
-                    {"role": "user", "content": prompt_request}
-                ]
-            )
+            message = self._create_message(
+                prompt_request, _max_tokens_for_chars(_IMAGE_PROMPT_MAX_CHARS))
 
             image_prompt = message.content[0].text.strip()
 
+            # The token cap can stop generation mid-word below the budget
+            if message.stop_reason == "max_tokens":
+                image_prompt = _trim_cut_off(image_prompt)
+
             # Remove quotes if Claude added them
             image_prompt = _strip_quotes(image_prompt)
 
@@ -805,8 +989,8 @@ FULL ARTICLE CONTENT (extract visual details from this):
             # prompts (lens, lighting, composition, film stock) translate
             # into materially better generations on Grok and especially on
             # Flux/Imagen if the model is swapped via the config flag.
-            if len(image_prompt) > 800:
-                image_prompt = image_prompt[:800]
+            if len(image_prompt) > _IMAGE_PROMPT_MAX_CHARS:
+                image_prompt = image_prompt[:_IMAGE_PROMPT_MAX_CHARS]
 
             print(f"✓ Generated image prompt: {image_prompt}")
             return image_prompt
@@ -815,3 +999,61 @@ FULL ARTICLE CONTENT (extract visual details from this):
             print(f"✗ Error generating image prompt: {e}")
             # Fallback to dramatic prompt with cat reporter ALWAYS
             return f"Close-up: Brown tabby reporter cat investigating {topic[:60]}, cinematic lighting, landscape format, press badge visible"
+
+    def generate_batch(self, requests: List[Dict], poll_interval: float = 5.0,
+                       timeout: float = _BATCH_POLL_TIMEOUT) -> Dict[str, str]:
+        """
+        Run independent prompts through the Message Batches API.
+
+        For offline bulk runs where no prompt depends on another's output:
+        one submission plus polling instead of one round trip per prompt,
+        at batch pricing.
+
+        Args:
+            requests: Dicts with 'custom_id', 'prompt' and optional 'max_tokens'
+            poll_interval: Seconds between status checks
+            timeout: Seconds to wait for the batch before giving up
+
+        Returns:
+            custom_id -> response text (quotes stripped) for every request that
+            succeeded; errored/expired requests are logged and left out
+
+        Raises:
+            TimeoutError: If the batch is still processing after timeout
+        """
+        batch = self.client.messages.batches.create(requests=[
+            {
+                "custom_id": req['custom_id'],
+                "params": self._build_params(req['prompt'], req.get('max_tokens', 350)),
+            }
+            for req in requests
+        ])
+        print(f"📦 Submitted batch {batch.id} ({len(requests)} requests)")
+        self.poll_batch(batch.id, interval=poll_interval, timeout=timeout)
+
+        texts = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == 'succeeded':
+                texts[entry.custom_id] = _strip_quotes(entry.result.message.content[0].text.strip())
+            else:
+                print(f"✗ Batch request {entry.custom_id} {entry.result.type}")
+        return texts
+
+    def poll_batch(self, batch_id: str, interval: float = 5.0,
+                   timeout: float = _BATCH_POLL_TIMEOUT):
+        """
+        Block until the batch has finished processing and return it.
+
+        Raises:
+            TimeoutError: If the batch is still processing after timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == 'ended':
+                return batch
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Batch {batch_id} still {batch.processing_status} after {timeout:g}s"
+                )
+            time.sleep(interval)
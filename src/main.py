@@ -48,11 +48,15 @@ from dossier_renderer import (
 from r2_uploader import upload_dossier_image, public_image_url
 
 
+# libyaml's C loader when PyYAML was built with it; pure-Python otherwise
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 def _load_config():
     """Load the project config.yaml and return parsed dict."""
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlSafeLoader)
 
 
 # ---------------------------------------------------------------------------
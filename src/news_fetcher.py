@@ -2,19 +2,51 @@
 Google News RSS integration for fetching real news articles
 """
 import feedparser
+import json
 import os
 import random
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Optional
 import time
 import re
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
 from googlenewsdecoder import gnewsdecoder
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from http.cookiejar import DefaultCookiePolicy
 from bs4 import BeautifulSoup
 from content_generator import _truncate_at_sentence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback when orjson is absent
+    orjson = None
+
+# BeautifulSoup tree builder: lxml's C parser when available (trafilatura
+# already pulls it in), otherwise the much slower pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:  # pragma: no cover - stdlib fallback when lxml is absent
+    _HTML_PARSER = 'html.parser'
+
+
+# Headline words of 3+ letters; shorter runs never count as trending terms
+_HEADLINE_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Common stop words to ignore when counting headline terms
+_HEADLINE_STOP_WORDS: frozenset[str] = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'been', 'be',
+    'this', 'that', 'these', 'those', 'it', 'can', 'will', 'says', 'after',
+    'has', 'have', 'had', 'not', 'what', 'who', 'why', 'how', 'new'
+})
+
 
 PAYWALL_INDICATORS: frozenset[str] = frozenset({
     'subscribe to continue', 'subscription required',
@@ -26,12 +58,169 @@ PAYWALL_INDICATORS: frozenset[str] = frozenset({
     'subscribe now', 'for full access',
 })
 
+# All indicators as one alternation, so each fetch stage scans the article
+# text once instead of once per indicator
+_PAYWALL_RE = re.compile('|'.join(
+    re.escape(indicator)
+    for indicator in sorted(PAYWALL_INDICATORS, key=len, reverse=True)
+))
+
+
+def _find_paywall_indicator(content_lower: str) -> Optional[str]:
+    """Return the first paywall indicator found in lowercased text, or None"""
+    match = _PAYWALL_RE.search(content_lower)
+    return match.group(0) if match else None
+
+# Upper bound on concurrent Google News RSS requests (keeps us under rate limits)
+FEED_FETCH_WORKERS = 10
+
+# Upper bound on concurrent article-body fetches and Google News URL
+# resolutions; these hit individual outlets, so stay gentler than the feeds
+ARTICLE_FETCH_WORKERS = 4
+
+# Direct-fetch article cache: revalidated with ETag/Last-Modified on later
+# runs. Entries expire on the same horizon as deduplication.max_history_days.
+ARTICLE_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'mewscast', 'articles-v1.json')
+ARTICLE_CACHE_MAX_AGE_DAYS = 30
+
+
+def _json_loads(raw: bytes):
+    """Parse cache JSON, preferring orjson's native decoder."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize cache JSON (compact), preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _write_article_cache(path: str, entries: Dict[str, Dict]):
+    """
+    Write cache entries to disk. Also the weakref.finalize callback for a
+    cache with unflushed changes, so they land when its fetcher is collected
+    or the interpreter exits.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(_json_dumps(entries))
+    except OSError as e:
+        print(f"   ⚠️  Could not save article cache: {e}")
+
+
+class _ArticleCache:
+    """
+    URL -> extracted article text, kept on disk with the HTTP validators.
+
+    Within a run, a URL that already produced text is answered from memory
+    with no request at all. Across runs, the stored ETag/Last-Modified are
+    sent back and a 304 reuses the stored text without re-parsing the HTML.
+    Changes are written by flush() after each fetch_article_contents batch,
+    and otherwise once the cache is garbage-collected or the interpreter exits.
+    """
+
+    def __init__(self, path: str, max_age_days: int = ARTICLE_CACHE_MAX_AGE_DAYS):
+        self.path = path
+        self.max_age = timedelta(days=max_age_days)
+        self.entries: Dict[str, Dict] = self._load()
+        self.fetched: Dict[str, str] = {}  # URL -> text obtained during this run
+        self._lock = threading.Lock()  # fetch_article_contents stores from worker threads
+        self._pending_write: Optional[weakref.finalize] = None  # armed while changes are unsaved
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'rb') as f:
+                entries = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        cutoff = (datetime.now(timezone.utc) - self.max_age).isoformat()
+        return {url: entry for url, entry in entries.items()
+                if entry.get('fetched_at', '') >= cutoff}
+
+    def flush(self):
+        """Write the cache to disk if anything changed since the last write"""
+        with self._lock:
+            if self._pending_write is None:
+                return
+            self._pending_write.detach()
+            self._pending_write = None
+            _write_article_cache(self.path, self.entries)
+
+    def _mark_dirty(self):
+        """Arm the finalizer that saves unflushed changes (call with _lock held)"""
+        if self._pending_write is None:
+            self._pending_write = weakref.finalize(self, _write_article_cache, self.path, self.entries)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional-request headers for a stored entry (empty if none)"""
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def revalidated(self, url: str) -> Optional[str]:
+        """Stored text after a 304, restarting the entry's max-age clock"""
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry:
+                return None
+            entry['fetched_at'] = datetime.now(timezone.utc).isoformat()
+            self._mark_dirty()
+            return entry['text']
+
+    def store(self, url: str, text: str, etag: Optional[str], last_modified: Optional[str]):
+        """Record a direct fetch (saved on flush); only revalidatable responses are worth keeping"""
+        if not (etag or last_modified):
+            return
+        with self._lock:
+            self.entries[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': datetime.now(timezone.utc).isoformat(),
+                'text': text,
+            }
+            self._mark_dirty()
+
 
 class NewsFetcher:
     """Fetches real news articles from Google News RSS"""
 
-    def __init__(self):
-        """Initialize news fetcher with search categories"""
+    def __init__(self, article_cache_path: Optional[str] = ARTICLE_CACHE_PATH):
+        """
+        Initialize news fetcher with search categories
+
+        Args:
+            article_cache_path: JSON file for the article content cache, or
+                None to fetch every article fresh
+        """
+        self._article_cache = _ArticleCache(article_cache_path) if article_cache_path else None
+
+        # One keep-alive session for article, Jina and Diffbot requests so
+        # repeat hosts skip the TCP/TLS handshake: up to 16 hosts stay pooled,
+        # each with a connection per fetch_article_contents worker. Cookies
+        # are never kept, so every request goes out as stateless as before
+        self._session = requests.Session()
+        self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=ARTICLE_FETCH_WORKERS)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # RSS URL -> (etag, modified, parsed feed) from the last 200 response,
+        # so repeat polls can send a conditional GET and reuse it on 304
+        self._feed_cache: Dict[str, tuple] = {}
+
         # Preferred major news sources (union of all usage sites)
         self.preferred_sources = [
             # Top Tier - Breaking news & major stories
@@ -218,8 +407,37 @@ class NewsFetcher:
             Extracted article text (up to ~6000 chars), or None if all
             four stages fail
         """
+        cache = self._article_cache
+        if cache is not None and url in cache.fetched:
+            return cache.fetched[url]
+
         print(f"   📄 Fetching article content from: {url[:60]}...")
+        content = self._fetch_article_uncached(url)
+        if cache is not None and content:
+            cache.fetched[url] = content
+        return content
 
+    def fetch_article_contents(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Fetch several articles concurrently (bounded by ARTICLE_FETCH_WORKERS).
+
+        Args:
+            urls: Article URLs; duplicates are fetched once
+
+        Returns:
+            Extracted text (or None) for each URL, in input order
+        """
+        if not urls:
+            return []
+        unique = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=min(ARTICLE_FETCH_WORKERS, len(unique))) as pool:
+            contents = dict(zip(unique, pool.map(self.fetch_article_content, unique)))
+        if self._article_cache is not None:
+            self._article_cache.flush()
+        return [contents[url] for url in urls]
+
+    def _fetch_article_uncached(self, url: str) -> Optional[str]:
+        """Run the four-stage fetch chain for fetch_article_content"""
         # Four-stage fetch chain — each stage has different IP infrastructure
         # and extraction methods, maximizing coverage across diverse outlets.
         # Total cost: $0/month at our volume (~35 articles/day).
@@ -260,15 +478,23 @@ class NewsFetcher:
                 'Upgrade-Insecure-Requests': '1'
             }
 
+            cache = self._article_cache
+            if cache is not None:
+                headers.update(cache.validators(url))
+
             response = None
             try:
-                response = requests.get(url, headers=headers, timeout=30, allow_redirects=True)
+                response = self._session.get(url, headers=headers, timeout=30, allow_redirects=True)
             except requests.exceptions.ReadTimeout:
                 print(f"   ⏳  Read timeout after 30s, retrying once...")
-                response = requests.get(url, headers=headers, timeout=30, allow_redirects=True)
+                response = self._session.get(url, headers=headers, timeout=30, allow_redirects=True)
+
+            if cache is not None and response.status_code == 304:
+                print(f"   ✓ Article unchanged since last fetch (304), using cached content")
+                return cache.revalidated(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, _HTML_PARSER)
 
             # Remove script and style elements
             for script in soup(["script", "style", "nav", "footer", "header"]):
@@ -321,13 +547,17 @@ class NewsFetcher:
 
                 # Check for paywall indicators
                 content_lower = article_content.lower()
-                for indicator in PAYWALL_INDICATORS:
-                    if indicator in content_lower:
-                        print(f"   ⚠️  Direct fetch: paywall detected ('{indicator}')")
-                        return None
+                indicator = _find_paywall_indicator(content_lower)
+                if indicator:
+                    print(f"   ⚠️  Direct fetch: paywall detected ('{indicator}')")
+                    return None
 
                 article_content = _truncate_at_sentence(article_content, 6000)
                 print(f"   ✓ Extracted {len(article_content)} chars of article content")
+                if cache is not None:
+                    cache.store(url, article_content,
+                                response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'))
                 return article_content
 
             print(f"   ⚠️  Direct fetch: could not extract article content from HTML")
@@ -355,7 +585,7 @@ class NewsFetcher:
                 'X-No-Cache': 'true',
             }
 
-            response = requests.get(jina_url, headers=jina_headers, timeout=30)
+            response = self._session.get(jina_url, headers=jina_headers, timeout=30)
             response.raise_for_status()
 
             content = response.text or ""
@@ -392,10 +622,10 @@ class NewsFetcher:
 
             # Same paywall check as direct fetch
             content_lower = article_content.lower()
-            for indicator in PAYWALL_INDICATORS:
-                if indicator in content_lower:
-                    print(f"   ⚠️  Jina Reader: paywall still detected ('{indicator}') — hard paywall")
-                    return None
+            indicator = _find_paywall_indicator(content_lower)
+            if indicator:
+                print(f"   ⚠️  Jina Reader: paywall still detected ('{indicator}') — hard paywall")
+                return None
 
             article_content = _truncate_at_sentence(article_content, 6000)
             print(f"   ✓ Jina Reader extracted {len(article_content)} chars of article content")
@@ -435,7 +665,7 @@ class NewsFetcher:
                 f"&url={requests.utils.quote(url, safe='')}"
             )
 
-            response = requests.get(diffbot_url, timeout=30)
+            response = self._session.get(diffbot_url, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -458,10 +688,10 @@ class NewsFetcher:
 
             # Same paywall check as other stages
             content_lower = article_text.lower()
-            for indicator in PAYWALL_INDICATORS:
-                if indicator in content_lower:
-                    print(f"   ⚠️  Diffbot: paywall still detected ('{indicator}') — hard paywall")
-                    return None
+            indicator = _find_paywall_indicator(content_lower)
+            if indicator:
+                print(f"   ⚠️  Diffbot: paywall still detected ('{indicator}') — hard paywall")
+                return None
 
             article_text = _truncate_at_sentence(article_text, 6000)
             print(f"   ✓ Diffbot extracted {len(article_text)} chars of article content")
@@ -588,10 +818,10 @@ class NewsFetcher:
 
             # Paywall detection — same indicators as other stages
             content_lower = article_text.lower()
-            for indicator in PAYWALL_INDICATORS:
-                if indicator in content_lower:
-                    print(f"   ⚠️  Playwright fallback: paywall detected ('{indicator}') — hard paywall")
-                    return None
+            indicator = _find_paywall_indicator(content_lower)
+            if indicator:
+                print(f"   ⚠️  Playwright fallback: paywall detected ('{indicator}') — hard paywall")
+                return None
 
             article_text = _truncate_at_sentence(article_text, 6000)
             print(f"   ✓ Playwright extracted {len(article_text)} chars of article content")
@@ -635,40 +865,25 @@ class NewsFetcher:
 
         print(f"🔍 Searching Google News RSS for categories: {', '.join(search_categories)}")
 
-        for category in search_categories:
-            # Search Google News RSS for this category
-            article = self.get_article_for_topic(category)
-
-            if article:
-                articles.append({
-                    'title': article['title'],
-                    'context': article['description'][:200],  # Limit description
-                    'url': article['url'],
-                    'source': article['source']
-                })
-
-            # Stop if we have enough
-            if len(articles) >= count:
-                break
+        def _collect(topic_articles: Dict[str, List[Dict]]):
+            for found in topic_articles.values():
+                if found and len(articles) < count:
+                    article = found[0]
+                    articles.append({
+                        'title': article['title'],
+                        'context': article['description'][:200],  # Limit description
+                        'url': article['url'],
+                        'source': article['source']
+                    })
 
-            # Small delay to be respectful to Google
-            time.sleep(0.5)
+        # Category feeds are fetched concurrently (bounded by FEED_FETCH_WORKERS)
+        _collect(self.get_articles_for_topics(search_categories, max_articles=1))
 
         # If we still don't have enough, search more categories
         if len(articles) < count:
             remaining_categories = [c for c in self.news_categories if c not in search_categories]
             random.shuffle(remaining_categories)
-
-            for category in remaining_categories[:count - len(articles)]:
-                article = self.get_article_for_topic(category)
-                if article:
-                    articles.append({
-                        'title': article['title'],
-                        'context': article['description'][:200],
-                        'url': article['url'],
-                        'source': article['source']
-                    })
-                time.sleep(0.5)
+            _collect(self.get_articles_for_topics(remaining_categories[:count - len(articles)], max_articles=1))
 
         if articles:
             print(f"✓ Fetched {len(articles)} articles from Google News RSS")
@@ -683,6 +898,56 @@ class NewsFetcher:
             'source': 'Google News'
         }]
 
+    def get_articles_for_topics(self, topics: List[str], max_articles: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Fetch articles for several topics concurrently
+
+        Each topic is still a single get_articles_for_topic() call; a bounded
+        thread pool overlaps the network round-trips so N feeds cost roughly
+        one feed's latency instead of N.
+
+        Args:
+            topics: Topics to search for
+            max_articles: Maximum number of articles per topic
+
+        Returns:
+            Dict mapping each topic (in input order) to its article list
+        """
+        if not topics:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(FEED_FETCH_WORKERS, len(topics))) as pool:
+            results = pool.map(
+                lambda topic: self.get_articles_for_topic(topic, max_articles=max_articles),
+                topics,
+            )
+            return dict(zip(topics, results))
+
+    def _parse_feed(self, rss_url: str, max_retries: int = 3):
+        """
+        feedparser.parse with exponential backoff when Google News returns HTTP 429.
+
+        Repeat polls of the same URL send the last ETag/Last-Modified; a 304
+        returns the previously parsed feed without downloading it again.
+        """
+        etag, modified, cached_feed = self._feed_cache.get(rss_url, (None, None, None))
+        for attempt in range(max_retries):
+            if cached_feed is not None:
+                feed = feedparser.parse(rss_url, etag=etag, modified=modified)
+            else:
+                feed = feedparser.parse(rss_url)
+            status = getattr(feed, 'status', None)
+            if status == 304 and cached_feed is not None:
+                return cached_feed
+            if status != 429 or attempt == max_retries - 1:
+                break
+            delay = 2 ** attempt
+            print(f"   ⏳  Google News rate limit (429), retrying in {delay}s...")
+            time.sleep(delay)
+        if status == 200 and (feed.get('etag') or feed.get('modified')):
+            self._feed_cache[rss_url] = (feed.get('etag'), feed.get('modified'), feed)
+        return feed
+
     def get_articles_for_topic(
         self,
         topic: str,
@@ -720,7 +985,7 @@ class NewsFetcher:
                 print(f"   Outlet filter active: {outlets}")
 
             # Parse RSS feed
-            feed = feedparser.parse(rss_url)
+            feed = self._parse_feed(rss_url)
 
             if not feed.entries:
                 print(f"   No articles found for '{topic}'")
@@ -770,19 +1035,19 @@ class NewsFetcher:
                     if not any(pref in source for pref in self.preferred_sources):
                         continue
 
-                # Resolve Google News proxy URL to actual article URL
-                actual_url = self.resolve_google_news_url(entry.link)
-
                 article = {
                     'title': entry.title,
                     'description': entry.get('summary', ''),
-                    'url': actual_url,
+                    'url': entry.link,
                     'source': source,
                     'published': published_str,
                     'published_date': published_date.isoformat() if published_str else None
                 }
                 articles.append(article)
 
+            # Resolve Google News proxy URLs to actual article URLs
+            self._resolve_article_urls(articles)
+
             if articles:
                 print(f"✓ Found {len(articles)} articles from major sources")
             return articles
@@ -791,6 +1056,19 @@ class NewsFetcher:
             print(f"✗ Error fetching articles for '{topic}': {e}")
             return []
 
+    def _resolve_article_urls(self, articles: List[Dict]):
+        """
+        Replace each article's Google News proxy URL with the real one, in place.
+        Resolved concurrently (bounded by ARTICLE_FETCH_WORKERS): each is a
+        network round trip through gnewsdecoder.
+        """
+        if not articles:
+            return
+        with ThreadPoolExecutor(max_workers=min(ARTICLE_FETCH_WORKERS, len(articles))) as pool:
+            resolved = pool.map(self.resolve_google_news_url, [a['url'] for a in articles])
+            for article, actual_url in zip(articles, resolved):
+                article['url'] = actual_url
+
     def get_top_stories(self, max_stories: int = 20) -> List[Dict]:
         """
         Fetch current top stories from Google News main feed
@@ -809,7 +1087,7 @@ class NewsFetcher:
             print(f"🔥 Fetching TOP STORIES from Google News (what's trending NOW)...")
 
             # Parse RSS feed
-            feed = feedparser.parse(rss_url)
+            feed = self._parse_feed(rss_url)
 
             if not feed.entries:
                 print(f"   ⚠️  No top stories found")
@@ -833,18 +1111,18 @@ class NewsFetcher:
 
                 # Prioritize major sources
                 if any(pref in source for pref in self.preferred_sources):
-                    actual_url = self.resolve_google_news_url(entry.link)
-
                     article = {
                         'title': entry.title,
                         'description': entry.get('summary', ''),
-                        'url': actual_url,
+                        'url': entry.link,
                         'source': source,
                         'published': published_str,
                         'published_date': published_date.isoformat() if published_date else None
                     }
                     articles.append(article)
 
+            self._resolve_article_urls(articles)
+
             if articles:
                 print(f"✓ Found {len(articles)} top stories from major sources")
                 for i, article in enumerate(articles[:5], 1):
@@ -867,45 +1145,21 @@ class NewsFetcher:
         Returns:
             List of trending topic strings (most frequent keywords/entities)
         """
-        from collections import Counter
-
         if not top_stories:
             return []
 
-        # Extract all words from headlines
-        all_words = []
-        proper_nouns = []
-
-        # Common stop words to ignore
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'been', 'be',
-            'this', 'that', 'these', 'those', 'it', 'can', 'will', 'says', 'after',
-            'has', 'have', 'had', 'not', 'what', 'who', 'why', 'how', 'new'
-        }
-
-        for story in top_stories:
-            title = story.get('title', '')
-
-            # Split into words
-            words = re.findall(r'\b[a-zA-Z]+\b', title)
-
-            for word in words:
-                word_lower = word.lower()
-
-                # Skip stop words and short words
-                if word_lower in stop_words or len(word) < 3:
-                    continue
-
-                # If capitalized, it's likely a proper noun (person, place, organization)
-                if word[0].isupper():
-                    proper_nouns.append(word)
-
-                all_words.append(word_lower)
+        # One findall over every headline; joining on newlines keeps words
+        # from running across titles
+        words = [
+            word for word in _HEADLINE_WORD_RE.findall(
+                '\n'.join(story.get('title', '') for story in top_stories))
+            if word.lower() not in _HEADLINE_STOP_WORDS
+        ]
 
-        # Count frequency of terms
-        word_counts = Counter(all_words)
-        noun_counts = Counter(proper_nouns)
+        # Count frequency of terms; capitalized words are likely proper nouns
+        # (person, place, organization)
+        word_counts = Counter(map(str.lower, words))
+        noun_counts = Counter(word for word in words if word[0].isupper())
 
         # Prioritize proper nouns (specific entities) and frequent keywords
         trending = []
@@ -916,8 +1170,9 @@ class NewsFetcher:
                 trending.append(noun)
 
         # Add top keywords (general topics)
+        seen = {t.lower() for t in trending}
         for word, count in word_counts.most_common(10):
-            if count >= 2 and word not in [t.lower() for t in trending]:
+            if count >= 2 and word not in seen:
                 trending.append(word)
 
         return trending[:15]  # Top 15 trending topics
@@ -2,31 +2,146 @@
 Post tracking and deduplication system
 Prevents posting duplicate stories or repeating topics too frequently
 """
+import heapq
 import json
 import os
 import re
+import weakref
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain, islice
 from typing import Dict, List, Optional
 
 from trend_detector import _extract_proper_nouns
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback when orjson is absent
+    orjson = None
+
 _BASE_STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
                     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'been', 'be'}
 _CONTENT_STOP_WORDS = _BASE_STOP_WORDS | {'this', 'that', 'it', 'can', 'will',
                                            'cat', 'mews', 'purr', 'paws', 'fur',
                                            'whisker', 'perch', 'meow'}
 
+# Hashtags, URLs and the source indicator carry no story content
+_CONTENT_NOISE_RE = re.compile(r'#\w+|http\S+|📰↓')
+
+# Default update keywords if not configured
+_DEFAULT_UPDATE_KEYWORDS = (
+    'update', 'updates', 'updated',
+    'breaking', 'developing',
+    'now', 'just', 'latest',
+    'reaction', 'responds', 'respond', 'response', 'reacts',
+    'after', 'following',
+    'says', 'claims', 'denies',
+    'walkback', 'reversal', 'u-turn',
+    'backlash', 'fallout', 'aftermath',
+    'shocked', 'surprise', 'surprising',
+    'announces', 'announcement',
+    'hits back', 'fires back', 'claps back'
+)
+
+# Pass as history_file to keep history purely in memory (no disk reads/writes)
+IN_MEMORY = ':memory:'
+
+
+def _stem_match_score(title_words: set, post_words: set, common_words: set) -> float:
+    """
+    Partial credit (0.5 per pair) for non-shared words of 4+ chars that share
+    a 5-char prefix, e.g. 'deploying' / 'deployment'.
+
+    Equivalent to comparing every (title word, post word) pair, but buckets
+    each side by prefix so the cost is linear rather than |title| * |post|.
+    """
+    title_prefixes = Counter(w[:5] for w in title_words if len(w) >= 4 and w not in common_words)
+    if not title_prefixes:
+        return 0
+    post_prefixes = Counter(w[:5] for w in post_words if len(w) >= 4 and w not in common_words)
+    return 0.5 * sum(n * post_prefixes[prefix] for prefix, n in title_prefixes.items()
+                     if prefix in post_prefixes)
+
+
+def _content_keywords(text: Optional[str]) -> frozenset:
+    """Lowercased words of post text, minus noise and stop words"""
+    if not text:
+        return frozenset()
+    return frozenset(_CONTENT_NOISE_RE.sub('', text).lower().split()) - _CONTENT_STOP_WORDS
+
+
+def _title_keys(words: frozenset, nouns: frozenset) -> set:
+    """
+    5-char prefixes of a title's (stop-word-free) words and proper nouns
+
+    Two titles that share a word, a stem-matched prefix (_stem_match_score) or
+    a proper noun always share one of these keys, so posts with no common key
+    can't score above zero in _find_story_cluster.
+    """
+    return {w[:5] for w in words} | {n[:5] for n in nouns}
+
+
+@lru_cache(maxsize=8)
+def _update_keywords_re(keywords: tuple) -> re.Pattern:
+    """One whole-word alternation over the update keywords, compiled once per keyword list"""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b')
+
+
+def _json_loads(raw: bytes):
+    """Parse history JSON, preferring orjson's native decoder."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize history JSON (2-space indent), preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Closing bytes of a non-empty history file as _json_dumps writes it; new
+# posts are spliced in just before them instead of rewriting the whole file
+_HISTORY_HEAD = b'{\n  "posts": [\n'
+_HISTORY_TAIL = b'\n  ]\n}'
+
+
+def _json_dumps_posts(posts: List[Dict]) -> bytes:
+    """Serialize a non-empty run of posts exactly as they appear inside the history file's list."""
+    return _json_dumps({'posts': posts})[len(_HISTORY_HEAD):-len(_HISTORY_TAIL)]
+
+
+def _write_pending_history(history_file: str, posts: List[Dict]):
+    """
+    Rewrite the history file with posts a batching tracker never flushed.
+    Runs as its weakref.finalize callback, i.e. when the tracker is garbage
+    collected or the interpreter exits first.
+    """
+    try:
+        with open(history_file, 'wb') as f:
+            f.write(_json_dumps({'posts': posts}))
+    except IOError as e:
+        print(f"⚠️  Could not save post history: {e}")
+
 
 class PostTracker:
     """Tracks posted stories to prevent duplicates"""
 
-    def __init__(self, history_file: str = None, config: Dict = None):
+    def __init__(self, history_file: str = None, config: Dict = None, flush_every: int = 1):
         """
         Initialize post tracker
 
         Args:
-            history_file: Path to JSON file storing post history (defaults to ../posts_history.json from src/)
+            history_file: Path to JSON file storing post history (defaults to ../posts_history.json from src/).
+                Pass IN_MEMORY (":memory:") to keep history in memory only.
             config: Configuration dict with deduplication settings
+            flush_every: Write the history file once every N changes instead of
+                on every change. Defaults to 1 (write-through) so a crash never
+                loses a live post; bulk callers can raise it and call flush()
+                (pending changes are also written if the tracker is garbage
+                collected or the interpreter exits first).
         """
         # Default to project root (parent directory of src/)
         if history_file is None:
@@ -41,15 +156,38 @@ class PostTracker:
             'url_deduplication': True,
             'max_history_days': 7
         }
+        # What the history file holds, so flushes that only add posts can
+        # append them (see _can_append)
+        self._saved_posts: Optional[List[Dict]] = None
+        self._saved_count = 0
+        self._saved_signature = None
+        self._needs_rewrite = False
         self.posts = self._load_history()
+        # Lookup indexes derived from self.posts (see _sync_indexes)
+        self._url_set: set = set()
+        self._content_index: Dict[str, List[int]] = defaultdict(list)  # keyword -> post positions
+        self._content_sizes: List[int] = []  # keyword count per post position
+        self._title_index: Dict[str, List[int]] = defaultdict(list)  # title key -> post positions
+        self._title_features: Dict[int, tuple] = {}  # post position -> (title words, proper nouns)
+        self._post_times: Dict[int, datetime] = {}  # post position -> parsed timestamp (see _post_time)
+        self._indexed_posts: Optional[List[Dict]] = None
+        self._indexed_count = 0
+        self._flush_every = max(1, int(flush_every))
+        self._dirty_count = 0
+        self._pending_write: Optional[weakref.finalize] = None
 
     def _load_history(self) -> List[Dict]:
         """Load post history from JSON file"""
+        if self.history_file == IN_MEMORY:
+            return []
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('posts', [])
+                with open(self.history_file, 'rb') as f:
+                    raw = f.read()
+                posts = _json_loads(raw).get('posts', [])
+                if raw.endswith(_HISTORY_TAIL):
+                    self._mark_saved(posts)
+                return posts
             return []
         except (json.JSONDecodeError, IOError) as e:
             print(f"⚠️  Could not load post history: {e}")
@@ -57,12 +195,77 @@ class PostTracker:
             return []
 
     def _save_history(self):
-        """Save post history to JSON file"""
+        """Save post history to JSON file, appending when only new posts were added"""
+        if self.history_file == IN_MEMORY:
+            return
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump({'posts': self.posts}, f, indent=2)
+            if self._can_append():
+                payload = _json_dumps_posts(self.posts[self._saved_count:])
+                with open(self.history_file, 'r+b') as f:
+                    f.seek(-len(_HISTORY_TAIL), os.SEEK_END)
+                    f.write(b',\n' + payload + _HISTORY_TAIL)
+            else:
+                payload = _json_dumps({'posts': self.posts})
+                with open(self.history_file, 'wb') as f:
+                    f.write(payload)
         except IOError as e:
             print(f"⚠️  Could not save post history: {e}")
+            return
+        self._mark_saved(self.posts)
+
+    def _file_signature(self):
+        """(mtime_ns, size) of the history file, or None if it can't be read"""
+        try:
+            st = os.stat(self.history_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _mark_saved(self, posts: List[Dict]):
+        """Record that the history file now holds exactly `posts`"""
+        self._saved_posts = posts
+        self._saved_count = len(posts)
+        self._saved_signature = self._file_signature()
+        self._needs_rewrite = False
+
+    def _can_append(self) -> bool:
+        """
+        True when the file still holds the first _saved_count of self.posts and
+        nothing has changed since but posts appended after them
+
+        A replaced list (cleanup_old_posts), an in-place edit (upsert_post), an
+        empty history or a file touched by someone else forces a full rewrite.
+        """
+        return (not self._needs_rewrite
+                and self.posts is self._saved_posts
+                and 0 < self._saved_count < len(self.posts)
+                and self._saved_signature is not None
+                and self._saved_signature == self._file_signature())
+
+    def _maybe_flush(self):
+        """Count one pending change and write history once the batch is full"""
+        self._dirty_count += 1
+        if self._dirty_count >= self._flush_every:
+            self.flush()
+        else:
+            self._arm_pending_write()
+
+    def _arm_pending_write(self):
+        """(Re)bind the finalizer that writes unflushed posts to the current list"""
+        if self.history_file == IN_MEMORY:
+            return
+        if self._pending_write is not None:
+            self._pending_write.detach()
+        self._pending_write = weakref.finalize(self, _write_pending_history, self.history_file, self.posts)
+
+    def flush(self):
+        """Write any pending history changes to disk"""
+        if self._pending_write is not None:
+            self._pending_write.detach()
+            self._pending_write = None
+        if self._dirty_count:
+            self._dirty_count = 0
+            self._save_history()
 
     def check_story_status(self, story_metadata: Dict, post_content: str = None) -> Dict:
         """
@@ -122,12 +325,55 @@ class PostTracker:
 
         return {'is_duplicate': False, 'is_update': False, 'previous_posts': [], 'cluster_info': None}
 
+    def _sync_indexes(self):
+        """
+        Bring the lookup indexes up to date with self.posts
+
+        Posts are normally appended (record_post, or callers appending to
+        self.posts directly), so only the unseen tail is indexed. A replaced
+        or shrunk list (e.g. after cleanup_old_posts) triggers a full rebuild.
+        """
+        if self._indexed_posts is not self.posts or len(self.posts) < self._indexed_count:
+            self._url_set = set()
+            self._content_index = defaultdict(list)
+            self._content_sizes = []
+            self._title_index = defaultdict(list)
+            self._title_features = {}
+            self._post_times = {}
+            self._indexed_posts = self.posts
+            self._indexed_count = 0
+
+        for i, post in enumerate(islice(self.posts, self._indexed_count, None), self._indexed_count):
+            url = post.get('url')
+            if url:
+                self._url_set.add(url)
+            words = _content_keywords(post.get('content'))
+            self._content_sizes.append(len(words))
+            if len(words) >= 3:
+                for word in words:
+                    self._content_index[word].append(i)
+            # Tokenize each title once here rather than on every cluster check
+            title = post.get('topic') or ''
+            title_words = frozenset(title.lower().split()) - _BASE_STOP_WORDS
+            if len(title_words) >= 2:
+                title_nouns = frozenset(self._extract_proper_nouns(title))
+                self._title_features[i] = (title_words, title_nouns)
+                for key in _title_keys(title_words, title_nouns):
+                    self._title_index[key].append(i)
+        self._indexed_count = len(self.posts)
+
+    def _post_time(self, i: int) -> datetime:
+        """Timestamp of self.posts[i], parsed on first use (call _sync_indexes first)"""
+        post_time = self._post_times.get(i)
+        if post_time is None:
+            post_time = datetime.fromisoformat(self.posts[i]['timestamp'].replace('Z', '+00:00'))
+            self._post_times[i] = post_time
+        return post_time
+
     def _url_posted(self, url: str) -> bool:
-        """Check if URL was already posted"""
-        for post in self.posts:
-            if post.get('url') == url:
-                return True
-        return False
+        """Check if URL was already posted (O(1) set lookup)"""
+        self._sync_indexes()
+        return url in self._url_set
 
     def _source_posted(self, source: str, hours: int = 168) -> bool:
         """
@@ -145,15 +391,14 @@ class PostTracker:
 
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
 
-        for post in self.posts:
-            # Check timestamp
-            post_time = datetime.fromisoformat(post['timestamp'].replace('Z', '+00:00'))
-            if post_time < cutoff_time:
-                continue  # Too old, outside cooldown period
-
+        self._sync_indexes()
+        for i, post in enumerate(self.posts):
             # Check if same source
-            post_source = post.get('source', '')
-            if post_source == source:
+            if post.get('source', '') != source:
+                continue
+
+            # Check timestamp
+            if self._post_time(i) >= cutoff_time:
                 return True
 
         return False
@@ -168,32 +413,13 @@ class PostTracker:
         Returns:
             True if title contains update keywords
         """
-        # Default update keywords if not configured
-        default_keywords = [
-            'update', 'updates', 'updated',
-            'breaking', 'developing',
-            'now', 'just', 'latest',
-            'reaction', 'responds', 'respond', 'response', 'reacts',
-            'after', 'following',
-            'says', 'claims', 'denies',
-            'walkback', 'reversal', 'u-turn',
-            'backlash', 'fallout', 'aftermath',
-            'shocked', 'surprise', 'surprising',
-            'announces', 'announcement',
-            'hits back', 'fires back', 'claps back'
-        ]
-
-        update_keywords = self.config.get('update_keywords', default_keywords)
-        title_lower = title.lower()
+        update_keywords = self.config.get('update_keywords', _DEFAULT_UPDATE_KEYWORDS)
+        if not update_keywords:
+            return False
 
         # Check for update keywords with word boundaries to avoid false matches
         # (e.g., "now" shouldn't match "known", "after" shouldn't match "afternoon")
-        for keyword in update_keywords:
-            # Use word boundaries to match whole words only
-            if re.search(r'\b' + re.escape(keyword) + r'\b', title_lower):
-                return True
-
-        return False
+        return _update_keywords_re(tuple(update_keywords)).search(title.lower()) is not None
 
     def _find_story_cluster(self, title: str, hours: int = 48) -> Dict:
         """
@@ -222,19 +448,21 @@ class PostTracker:
         related_posts = []
         max_similarity = 0.0
 
-        for post in self.posts:
+        # Only posts sharing a title key can be related (see _title_keys);
+        # visit them in history order so ties rank as before
+        self._sync_indexes()
+        candidates = set(chain.from_iterable(
+            self._title_index.get(key, ()) for key in _title_keys(title_words, title_nouns)))
+
+        for i in sorted(candidates):
+            post = self.posts[i]
             # Check timestamp
-            post_time = datetime.fromisoformat(post['timestamp'].replace('Z', '+00:00'))
-            if post_time < cutoff_time:
+            if self._post_time(i) < cutoff_time:
                 continue  # Too old
 
-            # Extract keywords from historical post
-            post_title = post.get('topic', '')
-            post_words = set(post_title.lower().split()) - _BASE_STOP_WORDS
-            post_nouns = self._extract_proper_nouns(post_title)
-
-            if len(post_words) < 2:
-                continue
+            # Keywords and entities of the historical post (only titles with
+            # 2+ keywords are indexed)
+            post_words, post_nouns = self._title_features[i]
 
             # Check entity overlap (proper nouns)
             common_nouns = title_nouns & post_nouns
@@ -243,14 +471,7 @@ class PostTracker:
             common_words = title_words & post_words
 
             # Add stem matching for better keyword detection
-            stem_matches = 0
-            for tw in title_words:
-                for pw in post_words:
-                    if tw not in common_words and pw not in common_words:
-                        # Check if words share significant prefix (stem matching)
-                        if len(tw) >= 4 and len(pw) >= 4:
-                            if tw[:5] == pw[:5] or tw[:6] == pw[:6]:
-                                stem_matches += 0.5  # Partial credit for stem match
+            stem_matches = _stem_match_score(title_words, post_words, common_words)
 
             effective_overlap = len(common_words) + stem_matches
             overlap_ratio = effective_overlap / max(len(title_words), len(post_words))
@@ -275,9 +496,6 @@ class PostTracker:
                 })
                 max_similarity = max(max_similarity, similarity_score)
 
-        # Sort by similarity (most similar first)
-        related_posts.sort(key=lambda x: x['similarity'], reverse=True)
-
         cluster_info = {
             'max_similarity': max_similarity,
             'num_related': len(related_posts),
@@ -285,7 +503,8 @@ class PostTracker:
         }
 
         return {
-            'related_posts': related_posts[:3],  # Return top 3 most similar
+            # Top 3 most similar (same order as a stable sort by similarity)
+            'related_posts': heapq.nlargest(3, related_posts, key=lambda x: x['similarity']),
             'cluster_info': cluster_info
         }
 
@@ -308,48 +527,33 @@ class PostTracker:
             return False
 
         # Clean content: remove hashtags, URLs, and source indicator
-        clean_content = re.sub(r'#\w+', '', content)  # Remove hashtags
-        clean_content = re.sub(r'http\S+', '', clean_content)  # Remove URLs
-        clean_content = re.sub(r'📰↓', '', clean_content)  # Remove source indicator
-
-        content_words = set(clean_content.lower().split()) - _CONTENT_STOP_WORDS
+        content_words = _content_keywords(content)
 
         if len(content_words) < 3:
             return False  # Content too short to compare meaningfully
 
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        # Get threshold from config (default 65%)
+        threshold = self.config.get('content_similarity_threshold', 0.65)
+
+        # Count shared keywords via the inverted index, so only posts with
+        # some overlap are looked at (posts with < 3 keywords aren't indexed)
+        self._sync_indexes()
+        shared = Counter(chain.from_iterable(
+            self._content_index.get(word, ()) for word in content_words))
+
+        for i in sorted(shared):
+            overlap_ratio = shared[i] / max(len(content_words), self._content_sizes[i])
+            if overlap_ratio < threshold:
+                continue
 
-        for post in self.posts:
             # Check timestamp
-            post_time = datetime.fromisoformat(post['timestamp'].replace('Z', '+00:00'))
+            post_time = self._post_time(i)
             if post_time < cutoff_time:
                 continue  # Too old, outside cooldown period
 
-            # Extract keywords from historical post content
-            post_content = post.get('content', '')
-            if not post_content:
-                continue  # No content stored (old format)
-
-            # Clean historical content same way
-            clean_post_content = re.sub(r'#\w+', '', post_content)
-            clean_post_content = re.sub(r'http\S+', '', clean_post_content)
-            clean_post_content = re.sub(r'📰↓', '', clean_post_content)
-
-            post_words = set(clean_post_content.lower().split()) - _CONTENT_STOP_WORDS
-
-            if len(post_words) < 3:
-                continue
-
-            # Calculate keyword overlap
-            common_words = content_words & post_words
-            overlap_ratio = len(common_words) / max(len(content_words), len(post_words))
-
-            # Get threshold from config (default 65%)
-            threshold = self.config.get('content_similarity_threshold', 0.65)
-
-            if overlap_ratio >= threshold:
-                print(f"   Content similarity: {overlap_ratio:.1%} with post from {post_time.strftime('%Y-%m-%d')}")
-                return True
+            print(f"   Content similarity: {overlap_ratio:.1%} with post from {post_time.strftime('%Y-%m-%d')}")
+            return True
 
         return False
 
@@ -397,7 +601,7 @@ class PostTracker:
         self.posts.append(post_record)
 
         # Save to disk (no pruning — analytics needs all-time history)
-        self._save_history()
+        self._maybe_flush()
 
         print(f"✓ Post recorded to history (total: {len(self.posts)} posts tracked)")
 
@@ -451,7 +655,8 @@ class PostTracker:
                 existing[k] = v
                 changed = True
         if changed:
-            self._save_history()
+            self._needs_rewrite = True
+            self._maybe_flush()
             print(f"✓ Post record updated for dossier {dossier_id}")
 
     def cleanup_old_posts(self):
@@ -461,10 +666,13 @@ class PostTracker:
 
         original_count = len(self.posts)
 
+        self._sync_indexes()
         self.posts = [
-            post for post in self.posts
-            if datetime.fromisoformat(post['timestamp'].replace('Z', '+00:00')) >= cutoff_time
+            post for i, post in enumerate(self.posts)
+            if self._post_time(i) >= cutoff_time
         ]
+        if self._dirty_count:
+            self._arm_pending_write()
 
         removed = original_count - len(self.posts)
         if removed > 0:
@@ -502,12 +710,9 @@ class PostTracker:
         Returns:
             List of post records that need source replies
         """
-        posts_needing_replies = []
-
-        for post in self.posts:
-            # Has URL but no reply posted yet
-            # Check both 'reply_tweet_id' (old format) and 'x_reply_tweet_id' (current format)
-            if post.get('url') and not (post.get('reply_tweet_id') or post.get('x_reply_tweet_id')):
-                posts_needing_replies.append(post)
-
-        return posts_needing_replies
+        # Has URL but no reply posted yet
+        # Check both 'reply_tweet_id' (old format) and 'x_reply_tweet_id' (current format)
+        return [
+            post for post in self.posts
+            if post.get('url') and not (post.get('reply_tweet_id') or post.get('x_reply_tweet_id'))
+        ]
@@ -3,7 +3,6 @@ Prompt loader utility for loading and formatting prompt templates from files
 """
 import os
 from typing import Dict, Optional
-from functools import lru_cache
 
 
 class PromptLoader:
@@ -23,16 +22,20 @@ class PromptLoader:
         self.prompts_dir = prompts_dir
         self._cache: Dict[str, str] = {}
 
-    @lru_cache(maxsize=20)
     def _load_raw(self, filename: str) -> str:
-        """Load raw prompt template from file (cached)"""
+        """Load raw prompt template from file (cached per loader)"""
+        template = self._cache.get(filename)
+        if template is not None:
+            return template
+
         filepath = os.path.join(self.prompts_dir, filename)
 
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Prompt file not found: {filepath}")
 
         with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+            template = self._cache[filename] = f.read()
+        return template
 
     def load(self, filename: str, **kwargs) -> str:
         """
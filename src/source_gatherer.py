@@ -396,8 +396,7 @@ class SourceGatherer:
         # search so the dossier has them even when keyword search returns 0.
         seed_articles: list[dict] = []
         if seed_urls:
-            for url in seed_urls:
-                body = self._fetch_body(url)
+            for url, body in zip(seed_urls, self._fetch_bodies(seed_urls)):
                 if not body:
                     print(f"[source_gatherer] seed URL fetch failed: {url[:80]}")
                     continue
@@ -463,10 +462,13 @@ class SourceGatherer:
                 break
             _take(entry)
 
-        # Fetch the article bodies for the chosen articles
+        # Fetch the article bodies for the chosen articles (one batch, so the
+        # fetcher can run them concurrently)
+        to_fetch = [e["url"] for e in chosen if not e.get("_prefetched_body")]
+        fetched = dict(zip(to_fetch, self._fetch_bodies(to_fetch)))
         article_records: list[ArticleRecord] = []
         for entry in chosen:
-            body = entry.get("_prefetched_body") or self._fetch_body(entry.get("url", ""))
+            body = entry.get("_prefetched_body") or fetched.get(entry["url"], "")
             if not body:
                 # Fall back to whatever the description was — better than nothing
                 body = entry.get("description", "") or ""
@@ -626,6 +628,23 @@ class SourceGatherer:
             print(f"[source_gatherer] body fetch failed for {url[:60]}: {e}")
             return ""
 
+    def _fetch_bodies(self, urls: list[str]) -> list[str]:
+        """Fetch several article bodies, in input order ("" for failures).
+
+        Uses NewsFetcher.fetch_article_contents (a bounded thread pool) when
+        the fetcher has it; otherwise, or if the batch raises, falls back to
+        one _fetch_body call per URL.
+        """
+        if not urls or not self.news_fetcher:
+            return [""] * len(urls)
+        fetch_many = getattr(self.news_fetcher, "fetch_article_contents", None)
+        if fetch_many is not None:
+            try:
+                return [body or "" for body in fetch_many(urls)]
+            except Exception as e:
+                print(f"[source_gatherer] batch body fetch failed, retrying one by one: {e}")
+        return [self._fetch_body(url) for url in urls]
+
     # ---- relevance filter --------------------------------------------------
 
     @staticmethod
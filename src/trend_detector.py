@@ -81,18 +81,17 @@ _SENTENCE_STARTERS = {
 }
 
 
+# Punctuation inside or around words; whitespace is kept so a single
+# sub() over the whole text leaves the same tokens as stripping word by word
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+
 def _extract_proper_nouns(text: str) -> set[str]:
     """Extract likely proper nouns (capitalized non-stop words) — case-folded."""
-    out: set[str] = set()
-    for word in text.split():
-        clean = re.sub(r'[^\w]', '', word)
-        if len(clean) <= 1:
-            continue
-        if clean in _SENTENCE_STARTERS:
-            continue
-        if clean[0].isupper():
-            out.add(clean.lower())
-    return out
+    return {
+        clean.lower() for clean in _NON_WORD_RE.sub('', text).split()
+        if len(clean) > 1 and clean[0].isupper() and clean not in _SENTENCE_STARTERS
+    }
 
 
 def _normalize_headline(text: str) -> str:
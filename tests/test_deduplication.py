@@ -14,10 +14,12 @@ Covers the PostTracker class (src/post_tracker.py) which is responsible for:
 All filesystem and network I/O is mocked so tests run in isolation.
 """
 
+import gc
 import json
 import os
 import sys
 import tempfile
+import weakref
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
@@ -27,7 +29,7 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
 
-from src.post_tracker import PostTracker
+from src.post_tracker import IN_MEMORY, PostTracker, _json_dumps, _stem_match_score
 
 
 # ---------------------------------------------------------------------------
@@ -132,6 +134,15 @@ class TestInitialization:
         t = PostTracker(history_file=str(bad_file))
         assert t.posts == []
 
+    def test_in_memory_history_never_touches_disk(self, default_config):
+        """IN_MEMORY keeps posts in the list only; nothing is read or written."""
+        t = PostTracker(history_file=IN_MEMORY, config=default_config)
+        with patch("builtins.open") as mock_file:
+            t.record_post(_make_story("Memory Story"), post_content="text")
+        mock_file.assert_not_called()
+        assert t.posts[0]["topic"] == "Memory Story"
+        assert not os.path.exists(IN_MEMORY)
+
     def test_load_valid_history(self, tmp_path):
         """Valid history file is loaded correctly."""
         history_file = tmp_path / "history.json"
@@ -174,6 +185,19 @@ class TestUrlDeduplication:
         result = t.check_story_status(story)
         assert result["is_duplicate"] is False
 
+    def test_url_index_tracks_appended_posts(self, tracker):
+        """Posts added after a lookup are still caught by the URL index."""
+        assert tracker._url_posted("https://example.com/late") is False
+        tracker.posts.append(_make_post("Late", "https://example.com/late"))
+        assert tracker._url_posted("https://example.com/late") is True
+
+    def test_url_index_rebuilt_after_cleanup(self, tracker):
+        """URLs pruned by cleanup_old_posts are no longer reported as posted."""
+        tracker.posts.append(_make_post("Old", "https://example.com/old", hours_ago=31 * 24))
+        assert tracker._url_posted("https://example.com/old") is True
+        tracker.cleanup_old_posts()
+        assert tracker._url_posted("https://example.com/old") is False
+
     def test_story_without_url(self, tracker):
         """A story with no URL skips the URL-level check entirely."""
         tracker.posts.append(_make_post("Story", "https://example.com/a"))
@@ -271,6 +295,17 @@ class TestContentSimilarity:
         # Most shared words are stop words, so meaningful overlap should be low
         assert result["is_duplicate"] is False
 
+    def test_content_index_follows_replaced_history(self, tracker):
+        """The keyword index is rebuilt when self.posts is swapped out."""
+        content = "Senate passes sweeping farm bill after marathon overnight session."
+        tracker.posts.append(_make_post("Farm", "https://example.com/1", content=content))
+        assert tracker._similar_content_posted(content) is True
+        tracker.posts = [_make_post("Other", "https://example.com/2",
+                                    content="Storm knocks out power across three states.")]
+        assert tracker._similar_content_posted(content) is False
+        tracker.posts.append(_make_post("Farm", "https://example.com/3", content=content))
+        assert tracker._similar_content_posted(content) is True
+
 
 # ===========================================================================
 # 4. Topic / title similarity (_find_story_cluster + check_story_status)
@@ -515,6 +550,16 @@ class TestStoryCluster:
         result = tracker._find_story_cluster("SpaceX Launch Success")
         assert len(result["related_posts"]) == 0
 
+    def test_cluster_matches_via_stem_or_noun_only(self, tracker):
+        """Posts sharing only a stem or a punctuated proper noun are still found."""
+        tracker.posts.append(_make_post("Deployment delays grow", "https://example.com/1"))
+        tracker.posts.append(_make_post("Unrelated farm bill", "https://example.com/2"))
+        tracker.posts.append(_make_post("(Zelensky) and (Macron) meet", "https://example.com/3"))
+        stem = tracker._find_story_cluster("Deploying delayed systems")
+        assert [r["post"]["topic"] for r in stem["related_posts"]] == ["Deployment delays grow"]
+        noun = tracker._find_story_cluster("Zelensky, Macron: summit talk")
+        assert [r["post"]["topic"] for r in noun["related_posts"]] == ["(Zelensky) and (Macron) meet"]
+
 
 # ===========================================================================
 # 7. Proper noun extraction
@@ -649,6 +694,81 @@ class TestRecordPost:
         assert post["url"] is None
         assert post["source"] == "Unknown"
 
+    def test_saved_history_round_trips_unicode(self, tracker, tmp_history):
+        """Non-ASCII post text survives a save/load cycle and stays stdlib-readable."""
+        tracker.record_post(_make_story("Café Story"), post_content="Purr-fect résumé 🐱")
+        reloaded = PostTracker(history_file=tmp_history)
+        assert reloaded.posts[0]["topic"] == "Café Story"
+        assert reloaded.posts[0]["content"] == "Purr-fect résumé 🐱"
+        with open(tmp_history, "r", encoding="utf-8") as f:
+            assert json.load(f)["posts"][0]["content"] == "Purr-fect résumé 🐱"
+
+    def test_flush_every_batches_disk_writes(self, tmp_history, default_config):
+        """With flush_every=N the file is only rewritten once N posts are pending."""
+        t = PostTracker(history_file=tmp_history, config=default_config, flush_every=3)
+        t.record_post(_make_story("One"), post_content="first")
+        t.record_post(_make_story("Two"), post_content="second")
+        with open(tmp_history, "r") as f:
+            assert json.load(f)["posts"] == []
+        t.record_post(_make_story("Three"), post_content="third")
+        with open(tmp_history, "r") as f:
+            assert len(json.load(f)["posts"]) == 3
+
+    def test_flush_writes_pending_posts(self, tmp_history, default_config):
+        """flush() persists a partial batch immediately."""
+        t = PostTracker(history_file=tmp_history, config=default_config, flush_every=10)
+        t.record_post(_make_story("Pending"), post_content="text")
+        t.flush()
+        with open(tmp_history, "r") as f:
+            assert json.load(f)["posts"][0]["topic"] == "Pending"
+
+    def test_collected_tracker_writes_pending_posts(self, tmp_history, default_config):
+        """A batching tracker dropped before flush() still persists its posts."""
+        t = PostTracker(history_file=tmp_history, config=default_config, flush_every=10)
+        for topic in ("One", "Two", "Three"):
+            t.record_post(_make_story(topic), post_content=topic.lower())
+        ref = weakref.ref(t)
+        del t
+        gc.collect()
+        assert ref() is None
+        with open(tmp_history, "r") as f:
+            assert [p["topic"] for p in json.load(f)["posts"]] == ["One", "Two", "Three"]
+
+    def test_flushed_tracker_does_not_rewrite_on_collect(self, tmp_history, default_config):
+        """flush() disarms the collection-time write."""
+        t = PostTracker(history_file=tmp_history, config=default_config, flush_every=10)
+        t.record_post(_make_story("Pending"), post_content="text")
+        t.flush()
+        os.remove(tmp_history)
+        del t
+        gc.collect()
+        assert not os.path.exists(tmp_history)
+
+    def test_new_posts_are_appended_in_place(self, tmp_history, default_config):
+        """Appending a post leaves the same bytes a full rewrite would."""
+        t = PostTracker(history_file=tmp_history, config=default_config)
+        t.record_post(_make_story("One"), post_content="first")
+        reloaded = PostTracker(history_file=tmp_history, config=default_config)
+        with patch("src.post_tracker._json_dumps", wraps=_json_dumps) as dumps:
+            reloaded.record_post(_make_story("Café"), post_content="second 🐱")
+            reloaded.record_post(_make_story("Three"), post_content="third")
+        # Only the new posts were serialized, never the whole history
+        assert all(len(c.args[0]["posts"]) == 1 for c in dumps.call_args_list)
+        with open(tmp_history, "rb") as f:
+            assert f.read() == _json_dumps({"posts": reloaded.posts})
+
+    def test_edited_or_pruned_history_is_rewritten(self, tmp_history, default_config):
+        """In-place edits and replaced post lists fall back to a full rewrite."""
+        t = PostTracker(history_file=tmp_history, config=default_config)
+        t.upsert_post(_make_story("One"), post_content="first", dossier_id="d1")
+        t.upsert_post(_make_story("One"), bluesky_uri="at://post/1", dossier_id="d1")
+        with open(tmp_history, "r") as f:
+            assert json.load(f)["posts"][0]["bluesky_uri"] == "at://post/1"
+        t.posts = [_make_post("Kept", "https://example.com/kept")]
+        t.record_post(_make_story("Two"), post_content="second")
+        with open(tmp_history, "r") as f:
+            assert [p["topic"] for p in json.load(f)["posts"]] == ["Kept", "Two"]
+
     # NOTE: `record_post` deliberately does NOT auto-prune any more —
     # analytics needs the full all-time history (see comment at
     # src/post_tracker.py near the "no pruning — analytics needs all-time
@@ -676,6 +796,15 @@ class TestCleanupOldPosts:
         tracker.cleanup_old_posts()
         assert tracker.posts == []
 
+    def test_repeated_cleanup_uses_current_positions(self, tracker):
+        """Timestamps cached by position are dropped when cleanup replaces the list."""
+        tracker.posts.append(_make_post("Old", "https://example.com/old", hours_ago=31*24))
+        tracker.posts.append(_make_post("Recent", "https://example.com/new", hours_ago=1))
+        tracker.cleanup_old_posts()
+        tracker.posts.append(_make_post("Older", "https://example.com/older", hours_ago=40*24))
+        tracker.cleanup_old_posts()
+        assert [p["topic"] for p in tracker.posts] == ["Recent"]
+
 
 # ===========================================================================
 # 11. filter_duplicates() bulk filtering
@@ -806,6 +935,23 @@ class TestStemMatching:
         # Combined with other shared words should trigger duplicate
         assert result["is_duplicate"] is True
 
+    @pytest.mark.parametrize("title_words, post_words", [
+        ({"deploying", "troops", "overseas"}, {"deployment", "troops", "sent"}),
+        ({"senate", "senator", "vote"}, {"senates", "senators", "voting"}),
+        ({"tax", "cut", "plan"}, {"taxes", "cuts", "plans"}),
+        (set(), {"anything"}),
+    ])
+    def test_stem_score_matches_pairwise_definition(self, title_words, post_words):
+        """The prefix-bucketed score equals the original all-pairs comparison."""
+        common = title_words & post_words
+        expected = 0
+        for tw in title_words:
+            for pw in post_words:
+                if tw not in common and pw not in common and len(tw) >= 4 and len(pw) >= 4:
+                    if tw[:5] == pw[:5] or tw[:6] == pw[:6]:
+                        expected += 0.5
+        assert _stem_match_score(title_words, post_words, common) == expected
+
 
 # ===========================================================================
 # 15. Edge cases and integration
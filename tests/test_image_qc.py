@@ -12,6 +12,7 @@ Scope:
 """
 import os
 import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -52,13 +53,9 @@ class TestGuardRails:
 # ---------------------------------------------------------------------------
 
 
-def _make_anthropic_response(text: str) -> MagicMock:
-    """Build a mock anthropic client response with .content[0].text = text."""
-    block = MagicMock()
-    block.text = text
-    response = MagicMock()
-    response.content = [block]
-    return response
+def _make_anthropic_response(text: str) -> SimpleNamespace:
+    """Build a stand-in anthropic response with .content[0].text = text."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
 
 
 class TestHaikuResponseParsing:
@@ -61,6 +61,21 @@ class _StubNewsFetcher:
         return self._bodies.get(url, "")
 
 
+class _BatchStubNewsFetcher(_StubNewsFetcher):
+    """Stub that also offers NewsFetcher.fetch_article_contents."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches = []
+
+    def fetch_article_contents(self, urls):
+        self.batches.append(list(urls))
+        return [self._bodies.get(url) for url in urls]
+
+    def fetch_article_content(self, url):
+        raise AssertionError("bodies should be fetched in a batch")
+
+
 @pytest.fixture
 def candidate():
     return _Candidate(
@@ -256,6 +271,24 @@ class TestGather:
 # Bug 4: _build_search_query — keyword extraction for Stage 3 queries
 # ---------------------------------------------------------------------------
 
+    def test_gather_fetches_bodies_in_one_batch(self, candidate, real_registry_path):
+        """Chosen article bodies go through fetch_article_contents together."""
+        articles = [
+            {"title": "Reuters", "url": "https://reuters.com/x", "source": "Reuters"},
+            {"title": "AP", "url": "https://apnews.com/y", "source": "AP News"},
+        ]
+        bodies = {"https://reuters.com/x": "Reuters body: the Senate passes the appropriations bill 68-32. " * 10}
+        fetcher = _BatchStubNewsFetcher(articles=articles, bodies=bodies)
+        gatherer = SourceGatherer(news_fetcher=fetcher, registry_path=real_registry_path)
+
+        dossier = gatherer.gather(candidate, target_count=5)
+
+        assert len(fetcher.batches) == 1
+        assert sorted(fetcher.batches[0]) == ["https://apnews.com/y", "https://reuters.com/x"]
+        by_url = {a.url: a for a in dossier.articles}
+        assert by_url["https://reuters.com/x"].body.startswith("Reuters body")
+
+
 class TestBuildSearchQuery:
     def test_empty_input_returns_empty(self):
         assert SourceGatherer._build_search_query("") == ""
@@ -117,6 +117,11 @@ class TestHelperFunctions:
         assert "reuters" in nouns
         assert "Reuters" not in nouns
 
+    def test_extract_proper_nouns_drops_punctuation_inside_words(self):
+        # Punctuation is removed, not split on: "U.S." -> "us", "Trump's" -> "trumps"
+        nouns = _extract_proper_nouns('U.S. weighs Trump\'s "Gaza" plan (A) — NATO')
+        assert nouns == {"us", "trumps", "gaza", "nato"}
+
     def test_normalize_headline_strips_urls(self):
         out = _normalize_headline("Senate vote https://t.co/abc123 happens now")
         assert "t.co" not in out